@@ -1,7 +1,10 @@
-from .units import Units, COMPOSITE_UNITS
-from .prefixes import Prefix, PREFIXES, add_prefix
-from .quantity import Quantity, parse_units
-from .convert import to_pretty_string, best_prefix, convert_unit, convert_prefix, register_conversion, make_units
+from .units import Units, COMPOSITE_UNITS, DIMENSIONLESS
+from .prefixes import Prefix, PREFIXES, EMPTY_PREFIX, add_prefix
+from .quantity import Quantity, parse_units, quantity_array
+from .convert import (
+    to_pretty_string, best_prefix, convert_unit, convert_prefix, register_conversion, make_units,
+    make_converter, refresh_units
+)
 from .physics import (
     speed, acceleration, force, momentum, impulse, kinetic_energy,
     potential_energy, mechanical_energy, work, power, energy_from_power,
@@ -28,9 +31,9 @@ from .constants import (
 )
 
 __all__ = [
-    "Units", "COMPOSITE_UNITS", "Prefix", "PREFIXES", "add_prefix", "Quantity",
-    "parse_units", "to_pretty_string", "best_prefix", "convert_unit", "convert_prefix", "make_units",
-    "register_conversion",
+    "Units", "COMPOSITE_UNITS", "DIMENSIONLESS", "Prefix", "PREFIXES", "EMPTY_PREFIX", "add_prefix", "Quantity",
+    "parse_units", "quantity_array", "to_pretty_string", "best_prefix", "convert_unit", "convert_prefix", "make_units",
+    "register_conversion", "make_converter", "refresh_units",
     
     "speed_of_light", "planck_constant", "planck_bar_constant", "standard_gravity",
     "gravitational_constant", "electron_charge", "elementary_charge",
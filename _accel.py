@@ -0,0 +1,86 @@
+"""
+Optional compiled kernels for array-valued quantities.
+The kernels are only used when numba is installed; physics.py falls back to
+plain NumPy expressions otherwise. numba is imported, and the kernels are
+compiled, the first time an array reaches one of them.
+"""
+
+import math
+from functools import lru_cache
+
+# Replaced by numba.prange in _load(), before any kernel is compiled
+prange = range
+
+# kernel function -> fastmath flag
+_KERNELS = {}
+
+
+def _kernel(fastmath=True):
+    """Register a kernel to be compiled with numba by _load()."""
+    def register(func):
+        _KERNELS[func] = fastmath
+        return func
+    return register
+
+@lru_cache(maxsize=None)
+def _load():
+    """Import numba and wrap every kernel with njit; empty dict when numba is missing."""
+    global prange
+    try:
+        import numba
+    except ImportError:
+        return {}
+    prange = numba.prange
+    return {
+        func: numba.njit(cache=True, fastmath=fastmath, parallel=True)(func)
+        for func, fastmath in _KERNELS.items()
+    }
+
+
+def use_kernel(*values) -> bool:
+    """True when any of `values` is an array (not a NumPy scalar) and numba is available."""
+    return any(getattr(v, "ndim", 0) > 0 for v in values) and bool(_load())
+
+def run_kernel(kernel, arrays, *constants):
+    """
+    Broadcast `arrays` together, run `kernel(*flat_arrays, *constants, out)`
+    over the flattened buffers and return `out` in the broadcast shape.
+    """
+    import numpy as np
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in arrays))
+    shape = arrays[0].shape
+    flat = [np.ascontiguousarray(a).ravel() for a in arrays]
+    out = np.empty(flat[0].size)
+    _load()[kernel](*flat, *constants, out)
+    return out.reshape(shape)
+
+
+# `scale` carries the ½ and the prefix factors of both arguments
+@_kernel()
+def kinetic_energy_kernel(mass, velocity, scale, out):
+    for i in prange(out.size):
+        out[i] = scale * mass[i] * velocity[i] * velocity[i]
+
+@_kernel()
+def orbital_velocity_kernel(mass, radius, g, out):
+    for i in prange(out.size):
+        out[i] = math.sqrt(g * mass[i] / radius[i])
+
+@_kernel()
+def escape_velocity_kernel(mass, radius, two_g, out):
+    for i in prange(out.size):
+        out[i] = math.sqrt(two_g * mass[i] / radius[i])
+
+# Inverse-square law (gravity, Coulomb); `scale` carries the constant and all prefix factors
+@_kernel()
+def inverse_square_kernel(a, b, distance, scale, out):
+    for i in prange(out.size):
+        r = distance[i]
+        out[i] = scale * a[i] * b[i] / (r * r)
+
+# No fastmath: it would allow (1 - β)(1 + β) to be rewritten as 1 - β²
+@_kernel(fastmath=False)
+def time_dilation_kernel(proper_time, velocity, c, out):
+    for i in prange(out.size):
+        beta = velocity[i] / c
+        out[i] = proper_time[i] / math.sqrt((1.0 - beta) * (1.0 + beta))
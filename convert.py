@@ -4,9 +4,11 @@ Works directly with Quantity objects.
 """
 
 import math
-from .quantity import Quantity, parse_units
-from .prefixes import PREFIXES_THOUSANDS, Prefix, PREFIXES
-from .units import COMPOSITE_UNITS, Units, UNIT_PRIORITY
+import sys
+from bisect import bisect_right
+from .quantity import Quantity, parse_units, _is_si_expr
+from .prefixes import PREFIXES_THOUSANDS, Prefix, PREFIXES, PREFIXES_FLOAT, EMPTY_PREFIX
+from .units import COMPOSITE_UNITS, Units, UNIT_PRIORITY, update_composite_names
 from fractions import Fraction
 
 # === Prefix conversion ===
@@ -21,16 +23,20 @@ def convert_prefix(quantity: Quantity, target_prefix_str: str) -> Quantity:
         2000.0 m
     """
     target_prefix = Prefix(target_prefix_str)
-    factor = Fraction(quantity.prefix.factor) / Fraction(target_prefix.factor)
-    new_value = quantity.value * factor  # Final conversion to float
-    return Quantity(new_value, target_prefix, quantity.units)
+    if quantity.prefix.symbol == target_prefix_str:
+        return quantity
+    ratio = quantity.prefix.factor / target_prefix.factor
+    return Quantity(quantity.value * ratio, target_prefix, quantity.units)
 
 # === Physical unit conversion ===
 
+# 1 eV in joules, exact by definition of the elementary charge
+_ELECTRON_VOLT = Fraction(1602176634, 10**28)
+
 _CONVERSIONS = {
     # Energy
-    ("J", "eV"): Fraction(1, 1602176634) * 10**10,  # Joule to electron-volt
-    ("eV", "J"): Fraction(1602176634, 10**19),
+    ("J", "eV"): 1 / _ELECTRON_VOLT,  # Joule to electron-volt
+    ("eV", "J"): _ELECTRON_VOLT,
     ("J", "kJ"): Fraction(1, 1000),
     ("kJ", "J"): 1000,
     ("J", "MJ"): Fraction(1, 1000000),
@@ -164,14 +170,28 @@ _CONVERSIONS = {
     ("K", "°C"): 1,
     ("°C", "K"): 1,
 }
+# Float copy of _CONVERSIONS nested as source -> target -> factor, used by
+# convert_unit; the exact values stay above
+_CONVERSIONS_ND = {}
+
+def _store_float_conversion(source_unit: str, target_unit: str, factor):
+    targets = _CONVERSIONS_ND.setdefault(sys.intern(source_unit), {})
+    targets[sys.intern(target_unit)] = float(factor)
+
+for (_source, _target), _factor in _CONVERSIONS.items():
+    _store_float_conversion(_source, _target, _factor)
+del _source, _target, _factor
+
 def convert_unit(quantity: Quantity, target_unit_symbol: str) -> Quantity:
     """
     Convert a quantity to a different but compatible physical unit.
+    The value is expressed in the target unit, but the result keeps the
+    dimensions of the input, so it is still displayed with the SI name.
 
     Example:
         >>> energy = Quantity(1, Prefix(''), COMPOSITE_UNITS['J'])
-        >>> convert_unit(energy, 'eV')
-        6.241509e+18 eV
+        >>> convert_unit(energy, 'eV').value
+        6.241509074460762e+18
     """
     source_unit = quantity.units.composite_name()
     if not source_unit:
@@ -179,20 +199,55 @@ def convert_unit(quantity: Quantity, target_unit_symbol: str) -> Quantity:
         if source_unit == "dimensionless":
             raise ValueError("Cannot convert dimensionless quantity")
 
-    key = (source_unit, target_unit_symbol)
-    if key not in _CONVERSIONS:
+    targets = _CONVERSIONS_ND.get(source_unit)
+    if targets is None or target_unit_symbol not in targets:
         raise ValueError(f"No known conversion from {source_unit} to {target_unit_symbol}")
 
-    factor = _CONVERSIONS[key]
-    new_value = quantity.value * factor
-    new_units = (COMPOSITE_UNITS[target_unit_symbol]
-                 if target_unit_symbol in COMPOSITE_UNITS
-                 else parse_units(target_unit_symbol))
-    return Quantity(new_value, Prefix(""), new_units)
+    factor = targets[target_unit_symbol]
+    # Conversion factors are between unprefixed units, fold the source prefix in
+    new_value = quantity.value * quantity.prefix.factor * factor
+    # Every registered conversion keeps the dimensions of its source
+    return Quantity(new_value, EMPTY_PREFIX, quantity.units)
+
+def make_converter(source_unit: str, target_unit: str):
+    """
+    Return a function converting Quantities from source_unit to target_unit.
+    The factor is looked up once, so each call is a single multiplication.
+    Quantities hold SI values, so source_unit must be an SI name ('J', 'm/s', not 'km' or 'mph').
+    As with convert_unit, the value is in target_unit but the units are kept.
+
+    Example:
+        >>> to_ev = make_converter('J', 'eV')
+        >>> to_ev(Quantity(1, Prefix(''), COMPOSITE_UNITS['J'])).value
+        6.241509074460762e+18
+    """
+    targets = _CONVERSIONS_ND.get(source_unit)
+    if targets is None or target_unit not in targets:
+        raise ValueError(f"No known conversion from {source_unit} to {target_unit}")
+    factor = targets[target_unit]
+    try:
+        source_units = COMPOSITE_UNITS.get(source_unit) or parse_units(source_unit)
+    except ValueError:
+        source_units = None  # e.g. 'km/h'
+    # The factor applies to the SI value, a prefixed or non-SI source would be off by its own factor
+    if source_units is None or not _is_si_expr(source_unit):
+        raise ValueError(f"Source must be an SI unit, not {source_unit}; use convert_unit")
+
+    def converter(quantity: Quantity) -> Quantity:
+        if quantity.units is not source_units and quantity.units != source_units:
+            raise ValueError(f"Cannot convert {quantity.units} from {source_unit}")
+        new_value = quantity.value * quantity.prefix.factor * factor
+        return Quantity(new_value, EMPTY_PREFIX, quantity.units)
+    return converter
 
 def register_conversion(source_unit: str, target_unit: str, factor: float | int | Fraction):
+    """Register `factor` from source_unit to target_unit and its exact reciprocal."""
+    factor = factor if isinstance(factor, Fraction) else Fraction(factor)
+    inverse = 1 / factor
     _CONVERSIONS[(source_unit, target_unit)] = factor
-    _CONVERSIONS[(target_unit, source_unit)] = 1 / factor
+    _CONVERSIONS[(target_unit, source_unit)] = inverse
+    _store_float_conversion(source_unit, target_unit, factor)
+    _store_float_conversion(target_unit, source_unit, inverse)
 def make_units(unit_dimensions: Units, repr: str, value: float | int | Fraction, priority: None | int = None):
     """Make Units
     unit_dimensions are the unit dimensions
@@ -205,7 +260,18 @@ def make_units(unit_dimensions: Units, repr: str, value: float | int | Fraction,
     register_conversion(str(unit_dimensions), repr, value)
     UNIT_PRIORITY[repr] = priority
     COMPOSITE_UNITS[repr] = unit_dimensions
+    refresh_units()
+
+def refresh_units():
+    """
+    Rebuild the unit name lookups and clear the parse_units cache.
+    Call it after editing COMPOSITE_UNITS or UNIT_PRIORITY directly; make_units does it for you.
+    """
+    update_composite_names()
+    parse_units.cache_clear()
 _EXPONENT_TO_PREFIX_THOUSANDS, _EXPONENT_TO_PREFIX = {}, {}
+# Sorted exponents available in each mapping, used to clamp best_prefix
+_EXPS_THOUSANDS, _EXPS_TENTH = [], []
 def update_exponent_to_prefixes():
     """Update the global exponent-to-prefix mappings based on PREFIXES and PREFIXES_THOUSANDS."""
     global _EXPONENT_TO_PREFIX_THOUSANDS, _EXPONENT_TO_PREFIX
@@ -216,8 +282,9 @@ def update_exponent_to_prefixes():
             try:
                 if factor == 0:
                     continue
-                exponent = int(math.log10(float(factor)))
-                result[exponent] = symbol
+                exponent = round(math.log10(factor))
+                # Keep the first symbol, e.g. "µ" over its "u" alias
+                result.setdefault(exponent, symbol)
             except (ValueError, OverflowError):
                 continue
         return result
@@ -226,25 +293,30 @@ def update_exponent_to_prefixes():
     _EXPONENT_TO_PREFIX.clear()
     _EXPONENT_TO_PREFIX_THOUSANDS.update(compute_mapping(PREFIXES_THOUSANDS))
     _EXPONENT_TO_PREFIX.update(compute_mapping(PREFIXES))
+    _EXPS_THOUSANDS[:] = sorted(_EXPONENT_TO_PREFIX_THOUSANDS)
+    _EXPS_TENTH[:] = sorted(_EXPONENT_TO_PREFIX)
+
+update_exponent_to_prefixes()
+assert set(range(_EXPS_THOUSANDS[0], _EXPS_THOUSANDS[-1] + 1, 3)) <= set(_EXPONENT_TO_PREFIX_THOUSANDS)
+assert set(range(_EXPS_TENTH[0], _EXPS_TENTH[-1] + 1)) <= set(_EXPONENT_TO_PREFIX)
 
 # === Automatic scaling to best prefix ===
 
 def best_prefix(quantity: Quantity, tenth: bool | None = None) -> Quantity:
-    tenth = bool(tenth)
-    abs_val = (quantity.value * quantity.prefix.factor
-                if abs(quantity.value * float(quantity.prefix.factor))
-                else Fraction(-1) * quantity.value * quantity.prefix.factor)
-    if abs_val == 0:
+    magnitude = abs(quantity.value) * quantity.prefix.factor
+    if magnitude == 0 or not math.isfinite(magnitude):
         return quantity
-    exponent = math.floor(math.log10(abs_val))
-    mapping = _EXPONENT_TO_PREFIX if tenth else _EXPONENT_TO_PREFIX_THOUSANDS
-    limit = 1 if tenth else 3  # log10(10)=1, log10(1000)=3
-    target_exponent = (exponent // limit) * limit
-    symbol = mapping.get(target_exponent, "")  # Fallback to no prefix
-    if not symbol:
+    if tenth:
+        mapping, exponents = _EXPONENT_TO_PREFIX, _EXPS_TENTH
+    else:
+        mapping, exponents = _EXPONENT_TO_PREFIX_THOUSANDS, _EXPS_THOUSANDS
+    exponent = math.floor(math.log10(magnitude))
+    # Largest available exponent not above the magnitude's, or the smallest one
+    index = bisect_right(exponents, exponent) - 1
+    symbol = mapping[exponents[max(index, 0)]]
+    if symbol == quantity.prefix.symbol:
         return quantity
-    factor = PREFIXES[symbol]
-    new_val = quantity.value * (float(quantity.prefix.factor) / float(factor))
+    new_val = quantity.value * (quantity.prefix.factor / PREFIXES_FLOAT[symbol])
     return Quantity(new_val, Prefix(symbol), quantity.units)
 
 
@@ -257,7 +329,7 @@ def to_pretty_string(quantity: Quantity, max_precision: int = 4, tenth: bool | N
     Example:
         >>> q = Quantity(0.00032, Prefix(''), Units(length=1))
         >>> to_pretty_string(q)
-        '0.32 mm'
+        '320.0 µm'
     """
     q_best = best_prefix(quantity, tenth=tenth)
     val = round(q_best.value, max_precision)
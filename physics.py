@@ -1,17 +1,106 @@
 """
 Physics helper functions for physunits.
 Each function operates on `Quantity` objects and preserves dimensional consistency.
+Quantities holding NumPy arrays (see `quantity_array`) are evaluated element-wise.
 """
 
 from .quantity import Quantity
-from .prefixes import Prefix
+from .prefixes import EMPTY_PREFIX
 from .units import Units
 from .constants import (
     standard_gravity, speed_of_light, boltzmann_constant, gas_constant,
     gravitational_constant, planck_constant
 )
+from ._accel import (
+    use_kernel, run_kernel, kinetic_energy_kernel, orbital_velocity_kernel,
+    escape_velocity_kernel, inverse_square_kernel, time_dilation_kernel
+)
 from math import sqrt
-from functools import wraps
+from functools import update_wrapper
+
+# Shared units for results built directly from floats
+_VELOCITY_UNITS = Units(length=1, time=-1)
+
+# Compound constants evaluated once at import
+_C_SQUARED = speed_of_light ** 2
+_INV_C_SQUARED = 1 / _C_SQUARED
+_C2_VAL = _C_SQUARED.value * _C_SQUARED.prefix.factor
+_G = gravitational_constant.value * gravitational_constant.prefix.factor
+_TWO_G = 2.0 * _G
+_NEG_G = -_G
+_R = gas_constant.value * gas_constant.prefix.factor
+
+def _any(condition) -> bool:
+    """Reduce a scalar or array comparison to a single bool."""
+    return bool(condition.any()) if hasattr(condition, "any") else bool(condition)
+
+def _sqrt(x):
+    """Square root of a float, a NumPy scalar or a NumPy array."""
+    return x ** 0.5 if getattr(x, "ndim", 0) > 0 else sqrt(x)
+
+def _si(q: Quantity):
+    """Value of `q` with its prefix applied."""
+    return q.value * q.prefix.factor
+
+def _half_product_squared(a: Quantity, b: Quantity):
+    """Value of ½ a b², through the compiled kernel for arrays."""
+    if use_kernel(a.value, b.value):
+        fb = b.prefix.factor
+        scale = 0.5 * a.prefix.factor * fb * fb
+        return run_kernel(kinetic_energy_kernel, (a.value, b.value), scale)
+    v = _si(b)
+    return 0.5 * _si(a) * v * v
+
+def _inverse_square(scale, a: Quantity, b: Quantity, distance: Quantity):
+    """Value of scale a b / r² for an SI float `scale`, through the compiled kernel for arrays."""
+    if use_kernel(a.value, b.value, distance.value) and getattr(scale, "ndim", 0) == 0:
+        fr = distance.prefix.factor
+        scale = scale * a.prefix.factor * b.prefix.factor / (fr * fr)
+        return run_kernel(inverse_square_kernel, (a.value, b.value, distance.value), scale)
+    r = _si(distance)
+    return scale * _si(a) * _si(b) / (r * r)
+
+# Only what callers and help() look at; no __dict__ merge or annotation copies
+_WRAPPER_ASSIGNED = ("__module__", "__name__", "__qualname__", "__doc__")
+
+def _nonzero_arg(func, index):
+    """Wrap `func` so that a zero at positional `index` (its denominator) raises."""
+    name = func.__code__.co_varnames[index]
+    def wrapper(*args, **kwargs):
+        arg = args[index] if len(args) > index else kwargs.get(name)
+        # Plain numbers (Quantity divides by them) and missing arguments go straight to func
+        if hasattr(arg, "value") and _any(arg.value == 0):
+            raise ValueError(f"{func.__name__}: argument {index+1} cannot be zero")
+        return func(*args, **kwargs)
+    return update_wrapper(wrapper, func, _WRAPPER_ASSIGNED, ())
+
+def _sqrt_positive_radius(func):
+    """Wrap `func(mass, radius)` so the value under its square root stays positive."""
+    def wrapper(mass, radius):
+        if _any(mass.value < 0):
+            raise ValueError("Mass cannot be negative")
+        if _any(radius.value <= 0):
+            raise ValueError("Radius must be positive")
+        return func(mass, radius)
+    return update_wrapper(wrapper, func, _WRAPPER_ASSIGNED, ())
+
+def _subluminal_velocity(func):
+    """Wrap `func(proper_time, velocity)` so that |v| >= c raises."""
+    def wrapper(proper_time, velocity):
+        v = velocity.value * velocity.prefix.factor
+        if _any(v * v >= _C2_VAL):
+            raise ValueError("Velocity cannot be equal to or exceed the speed of light")
+        return func(proper_time, velocity)
+    return update_wrapper(wrapper, func, _WRAPPER_ASSIGNED, ())
+
+# Index of the argument each helper divides by
+_DENOMINATOR_ARG = {
+    'speed': 1, 'acceleration': 1, 'power': 1, 'pressure': 1, 'ideal_gas_pressure': 1,
+    'electric_field': 1, 'capacitance': 1, 'current': 1, 'frequency_from_period': 0,
+    'photon_energy_from_wavelength': 0, 'refractive_index': 1, 'gravitational_force': 2,
+    'gravitational_potential_energy': 2, 'density': 1, 'flow_rate': 1,
+    'continuity_equation': 2,
+}
 
 def physics_safe(func):
     """
@@ -19,38 +108,16 @@ def physics_safe(func):
     - Division by zero
     - Negative values for sqrt
     - Velocities exceeding speed of light
+    The check is picked once from the function name; helpers without one are returned as-is.
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        # Check for Quantity arguments with zero values in denominators
-        for i, arg in enumerate(args):
-            if hasattr(arg, 'value') and arg.value == 0:
-                if func.__name__ in (
-                    'speed', 'acceleration', 'power', 'pressure', 'ideal_gas_pressure',
-                    'electric_field', 'capacitance', 'current', 'frequency_from_period',
-                    'photon_energy_from_wavelength', 'refractive_index', 'gravitational_force',
-                    'gravitational_potential_energy', 'density', 'flow_rate',
-                    'continuity_equation'
-                ):
-                    raise ValueError(f"{func.__name__}: argument {i+1} cannot be zero")
-
-        # Special check for sqrt of negative values
-        if func.__name__ in ('orbital_velocity', 'escape_velocity'):
-            mass = args[0]
-            radius = args[1]
-            if mass.value < 0:
-                raise ValueError("Mass cannot be negative")
-            if radius.value <= 0:
-                raise ValueError("Radius must be positive")
-
-        # Special check for time_dilation
-        if func.__name__ == 'time_dilation':
-            velocity = args[1]
-            if abs(velocity.value) >= speed_of_light.value:
-                raise ValueError("Velocity cannot be equal to or exceed the speed of light")
-
-        return func(*args, **kwargs)
-    return wrapper
+    name = func.__name__
+    if name in _DENOMINATOR_ARG:
+        return _nonzero_arg(func, _DENOMINATOR_ARG[name])
+    if name in ('orbital_velocity', 'escape_velocity'):
+        return _sqrt_positive_radius(func)
+    if name == 'time_dilation':
+        return _subluminal_velocity(func)
+    return func
 
 # === MECHANICS ===
 @physics_safe
@@ -76,15 +143,19 @@ def impulse(force: Quantity, time: Quantity) -> Quantity:
 
 def kinetic_energy(mass: Quantity, velocity: Quantity) -> Quantity:
     """E_k = ½ m v²"""
-    return Quantity(0.5, Prefix(""), Units()) * mass * (velocity ** 2)
+    value = _half_product_squared(mass, velocity)
+    return Quantity(value, EMPTY_PREFIX, mass.units * velocity.units ** 2)
 
 def potential_energy(mass: Quantity, height: Quantity, gravity=standard_gravity) -> Quantity:
     """E_p = m * g * h"""
-    return mass * gravity * height
+    value = _si(mass) * _si(gravity) * _si(height)
+    return Quantity(value, EMPTY_PREFIX, mass.units * gravity.units * height.units)
 
 def mechanical_energy(kinetic: Quantity, potential: Quantity) -> Quantity:
     """E_total = E_k + E_p"""
-    return kinetic + potential
+    if kinetic.units != potential.units:
+        raise ValueError("Incompatible units for addition")
+    return Quantity(_si(kinetic) + _si(potential), EMPTY_PREFIX, kinetic.units)
 
 def work(force: Quantity, distance: Quantity) -> Quantity:
     """W = F * d"""
@@ -111,7 +182,8 @@ def angular_momentum(moment_of_inertia: Quantity, angular_velocity: Quantity) ->
 
 def rotational_kinetic_energy(moment_of_inertia: Quantity, angular_velocity: Quantity) -> Quantity:
     """E_rot = ½ I ω²"""
-    return Quantity(0.5, Prefix(""), Units()) * moment_of_inertia * (angular_velocity ** 2)
+    value = _half_product_squared(moment_of_inertia, angular_velocity)
+    return Quantity(value, EMPTY_PREFIX, moment_of_inertia.units * angular_velocity.units ** 2)
 
 
 # === THERMODYNAMICS ===
@@ -126,11 +198,15 @@ def temperature_from_energy_per_particle(energy: Quantity) -> Quantity:
 @physics_safe
 def ideal_gas_pressure(n_moles: Quantity, volume: Quantity, temperature: Quantity) -> Quantity:
     """P = nRT / V"""
-    return n_moles * gas_constant * temperature / volume
+    value = _si(n_moles) * _R * _si(temperature) / _si(volume)
+    units = n_moles.units * gas_constant.units * temperature.units / volume.units
+    return Quantity(value, EMPTY_PREFIX, units)
 
 def heat_from_specific_heat(mass: Quantity, specific_heat_capacity: Quantity, temperature_change: Quantity) -> Quantity:
     """Q = m * c * ΔT"""
-    return mass * specific_heat_capacity * temperature_change
+    value = _si(mass) * _si(specific_heat_capacity) * _si(temperature_change)
+    units = mass.units * specific_heat_capacity.units * temperature_change.units
+    return Quantity(value, EMPTY_PREFIX, units)
 
 def thermal_energy_from_temperature(temperature: Quantity) -> Quantity:
     """E = k_B * T"""
@@ -141,7 +217,9 @@ def thermal_energy_from_temperature(temperature: Quantity) -> Quantity:
 @physics_safe
 def electric_force(charge1: Quantity, charge2: Quantity, distance: Quantity, k_coulomb: Quantity) -> Quantity:
     """F = k * q1 * q2 / r²"""
-    return k_coulomb * charge1 * charge2 / (distance ** 2)
+    value = _inverse_square(_si(k_coulomb), charge1, charge2, distance)
+    units = k_coulomb.units * charge1.units * charge2.units / distance.units ** 2
+    return Quantity(value, EMPTY_PREFIX, units)
 @physics_safe
 def electric_field(force: Quantity, charge: Quantity) -> Quantity:
     """E = F / q"""
@@ -161,7 +239,8 @@ def capacitance(charge: Quantity, voltage: Quantity) -> Quantity:
 
 def energy_stored_in_capacitor(capacitance: Quantity, voltage: Quantity) -> Quantity:
     """U = ½ C V²"""
-    return Quantity(0.5, Prefix(""), Units()) * capacitance * (voltage ** 2)
+    value = _half_product_squared(capacitance, voltage)
+    return Quantity(value, EMPTY_PREFIX, capacitance.units * voltage.units ** 2)
 @physics_safe
 def current(charge: Quantity, time: Quantity) -> Quantity:
     """I = Q / t"""
@@ -184,7 +263,7 @@ def wave_speed(frequency: Quantity, wavelength: Quantity) -> Quantity:
 @physics_safe
 def frequency_from_period(period: Quantity) -> Quantity:
     """f = 1 / T"""
-    return Quantity(1, Prefix(""), Units()) / period
+    return 1 / period
 
 def photon_energy(frequency: Quantity, planck_constant: Quantity = planck_constant) -> Quantity:
     """E = h * f"""
@@ -192,7 +271,9 @@ def photon_energy(frequency: Quantity, planck_constant: Quantity = planck_consta
 @physics_safe
 def photon_energy_from_wavelength(wavelength: Quantity, planck_constant: Quantity = planck_constant) -> Quantity:
     """E = h * c / λ"""
-    return planck_constant * speed_of_light / wavelength
+    value = _si(planck_constant) * _si(speed_of_light) / _si(wavelength)
+    units = planck_constant.units * speed_of_light.units / wavelength.units
+    return Quantity(value, EMPTY_PREFIX, units)
 @physics_safe
 def refractive_index(speed_in_vacuum: Quantity, speed_in_medium: Quantity) -> Quantity:
     """n = c / v"""
@@ -203,34 +284,54 @@ def refractive_index(speed_in_vacuum: Quantity, speed_in_medium: Quantity) -> Qu
 @physics_safe
 def gravitational_force(mass1: Quantity, mass2: Quantity, distance: Quantity) -> Quantity:
     """F = G * m1 * m2 / r²"""
-    return gravitational_constant * mass1 * mass2 / (distance ** 2)
+    value = _inverse_square(_G, mass1, mass2, distance)
+    units = gravitational_constant.units * mass1.units * mass2.units / distance.units ** 2
+    return Quantity(value, EMPTY_PREFIX, units)
 @physics_safe
 def orbital_velocity(mass_central: Quantity, radius: Quantity) -> Quantity:
     """v = sqrt(GM / r)"""
-    value = sqrt(gravitational_constant.value * mass_central.value / radius.value)
-    return Quantity(value, Prefix(""), Units(length=1, time=-1))
+    # Prefix factors fold into the constant, so the core works on raw values
+    g = _G * mass_central.prefix.factor / radius.prefix.factor
+    if use_kernel(mass_central.value, radius.value):
+        value = run_kernel(orbital_velocity_kernel, (mass_central.value, radius.value), g)
+    else:
+        value = _sqrt(g * mass_central.value / radius.value)
+    return Quantity(value, EMPTY_PREFIX, _VELOCITY_UNITS)
 @physics_safe
 def escape_velocity(mass: Quantity, radius: Quantity) -> Quantity:
     """v_esc = sqrt(2GM / r)"""
-    value = sqrt(2 * gravitational_constant.value * mass.value / radius.value)
-    return Quantity(value, Prefix(""), Units(length=1, time=-1))
+    two_g = _TWO_G * mass.prefix.factor / radius.prefix.factor
+    if use_kernel(mass.value, radius.value):
+        value = run_kernel(escape_velocity_kernel, (mass.value, radius.value), two_g)
+    else:
+        value = _sqrt(two_g * mass.value / radius.value)
+    return Quantity(value, EMPTY_PREFIX, _VELOCITY_UNITS)
 @physics_safe
 def gravitational_potential_energy(mass1: Quantity, mass2: Quantity, distance: Quantity) -> Quantity:
     """U = -G * m1 * m2 / r"""
-    return Quantity(-1, Prefix(""), Units()) * gravitational_constant * mass1 * mass2 / distance
+    value = _NEG_G * _si(mass1) * _si(mass2) / _si(distance)
+    units = gravitational_constant.units * mass1.units * mass2.units / distance.units
+    return Quantity(value, EMPTY_PREFIX, units)
 
 def energy_mass_equivalence(mass: Quantity) -> Quantity:
     """E = m * c²"""
-    return mass * (speed_of_light ** 2)
+    return mass * _C_SQUARED
 @physics_safe
 def time_dilation(proper_time: Quantity, velocity: Quantity) -> Quantity:
     """t = t₀ / sqrt(1 - v² / c²)"""
-    factor = 1 / sqrt(1 - (velocity.value / speed_of_light.value) ** 2)
+    # Speed of light expressed in the velocity's prefix
+    c = speed_of_light.value / velocity.prefix.factor
+    if use_kernel(proper_time.value, velocity.value):
+        value = run_kernel(time_dilation_kernel, (proper_time.value, velocity.value), c)
+        return Quantity(value, proper_time.prefix, proper_time.units)
+    beta = velocity.value / c
+    # (1 - β)(1 + β) avoids cancellation in 1 - β² as v approaches c
+    factor = 1.0 / _sqrt((1.0 - beta) * (1.0 + beta))
     return Quantity(proper_time.value * factor, proper_time.prefix, proper_time.units)
 @physics_safe
 def gravitational_redshift(delta_phi: Quantity) -> Quantity:
     """z ≈ Δφ / c²"""
-    return delta_phi / (speed_of_light ** 2)
+    return delta_phi * _INV_C_SQUARED
 
 
 # === FLUID DYNAMICS ===
@@ -240,17 +341,24 @@ def density(mass: Quantity, volume: Quantity) -> Quantity:
     return mass / volume
 def pressure_from_depth(density: Quantity, gravity: Quantity, depth: Quantity) -> Quantity:
     """P = ρgh"""
-    return density * gravity * depth
+    value = _si(density) * _si(gravity) * _si(depth)
+    return Quantity(value, EMPTY_PREFIX, density.units * gravity.units * depth.units)
 
 def buoyant_force(density_fluid: Quantity, volume_submerged: Quantity, gravity: Quantity = standard_gravity) -> Quantity:
     """F_b = ρ * V * g"""
-    return density_fluid * volume_submerged * gravity
+    value = _si(density_fluid) * _si(volume_submerged) * _si(gravity)
+    units = density_fluid.units * volume_submerged.units * gravity.units
+    return Quantity(value, EMPTY_PREFIX, units)
 
 def bernoulli_pressure(pressure_static: Quantity, density: Quantity, velocity: Quantity, height: Quantity, gravity: Quantity = standard_gravity) -> Quantity:
     """Bernoulli: P_total = P + ½ρv² + ρgh"""
-    kinetic_term = Quantity(0.5, Prefix(""), Units()) * density * (velocity ** 2)
-    potential_term = density * gravity * height
-    return pressure_static + kinetic_term + potential_term
+    if (density.units * velocity.units ** 2 != pressure_static.units
+            or density.units * gravity.units * height.units != pressure_static.units):
+        raise ValueError("Incompatible units for addition")
+    rho = _si(density)
+    v = _si(velocity)
+    value = _si(pressure_static) + 0.5 * rho * v * v + rho * _si(gravity) * _si(height)
+    return Quantity(value, EMPTY_PREFIX, pressure_static.units)
 @physics_safe
 def flow_rate(volume: Quantity, time: Quantity) -> Quantity:
     """Q = V / t"""
@@ -258,4 +366,5 @@ def flow_rate(volume: Quantity, time: Quantity) -> Quantity:
 @physics_safe
 def continuity_equation(area1: Quantity, velocity1: Quantity, area2: Quantity) -> Quantity:
     """A₁v₁ = A₂v₂  → v₂ = A₁v₁ / A₂"""
-    return (area1 * velocity1) / area2
+    value = _si(area1) * _si(velocity1) / _si(area2)
+    return Quantity(value, EMPTY_PREFIX, area1.units * velocity1.units / area2.units)
@@ -21,22 +21,49 @@ def valid_combo(t, th):
     return (vt > 1 and vth > 1) or (vt < 1 and vth < 1) or vt == 1 or vth == 1
 
 def build_prefix_dict():
-    """Rebuild combined PREFIXES dictionary.""" 
+    """Rebuild combined PREFIXES dictionary (the source tables already hold Fractions).""" 
     return {
-        th + t: Fraction(PREFIXES_TENTHS[t]) * Fraction(PREFIXES_THOUSANDS[th])
-        for th in PREFIXES_THOUSANDS
-        for t in PREFIXES_TENTHS
+        th + t: tv * thv
+        for th, thv in PREFIXES_THOUSANDS.items()
+        for t, tv in PREFIXES_TENTHS.items()
         if valid_combo(t, th)
     }
 
 PREFIXES = build_prefix_dict()
+# Float view of PREFIXES for arithmetic, kept in sync by add_prefix
+PREFIXES_FLOAT = {k: float(v) for k, v in PREFIXES.items()}
 
 class Prefix:
-    def __init__(self, symbol: str):
-        if symbol not in PREFIXES:
-            raise ValueError(f"Invalid prefix: {symbol}")
-        self.symbol = symbol
-        self.factor = PREFIXES[symbol]
+    """
+    SI prefix: `factor` is a float for arithmetic, `exact_factor` the exact Fraction.
+    Instances are cached per symbol, so Prefix("k") returns the same object every time,
+    and are immutable.
+    """
+    __slots__ = ("symbol", "factor", "exact_factor")
+    _CACHE = {}
+
+    def __new__(cls, symbol: str):
+        prefix = cls._CACHE.get(symbol)
+        if prefix is None:
+            if symbol not in PREFIXES:
+                raise ValueError(f"Invalid prefix: {symbol}")
+            prefix = object.__new__(cls)
+            # __setattr__ is blocked, so slots are filled through object's
+            set_slot = object.__setattr__
+            set_slot(prefix, "symbol", symbol)
+            set_slot(prefix, "exact_factor", PREFIXES[symbol])
+            set_slot(prefix, "factor", PREFIXES_FLOAT[symbol])
+            cls._CACHE[symbol] = prefix
+        return prefix
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Prefix instances are immutable, cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Prefix instances are immutable, cannot delete {name!r}")
+
+    def __reduce__(self):
+        return (Prefix, (self.symbol,))
 
     def __repr__(self):
         return self.symbol
@@ -51,7 +78,7 @@ class Prefix:
         if not isinstance(other, Prefix):
             return NotImplemented
 
-        product_factor = self.factor * other.factor
+        product_factor = self.exact_factor * other.exact_factor
 
         # Find an existing prefix with this factor
         for symbol, factor in PREFIXES.items():
@@ -69,7 +96,7 @@ class Prefix:
         if other.factor == 0:
             raise ZeroDivisionError("Cannot divide by a zero-factor prefix")
 
-        quotient_factor = self.factor / other.factor
+        quotient_factor = self.exact_factor / other.exact_factor
 
         # Find an existing prefix with this factor
         for symbol, factor in PREFIXES.items():
@@ -82,6 +109,9 @@ class Prefix:
         )
 
 
+# Shared unprefixed instance, reused for every result built without a prefix
+EMPTY_PREFIX = Prefix("")
+
 def get_prefix_factor(symbol: str):
     try:
         return PREFIXES[symbol]
@@ -109,5 +139,7 @@ def add_prefix(symbol: str, factor, inverse_symbol: str | None = None):
     # Rebuild combined dictionary
     PREFIXES.clear()
     PREFIXES.update(build_prefix_dict())
+    PREFIXES_FLOAT.clear()
+    PREFIXES_FLOAT.update({k: float(v) for k, v in PREFIXES.items()})
     update_exponent_to_prefixes()
     return f"Prefix '{symbol}' added successfully with factor {factor}"
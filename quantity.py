@@ -1,54 +1,97 @@
 import re
-from .prefixes import Prefix, PREFIXES
-from units import Units, COMPOSITE_UNITS
+from fractions import Fraction
+from functools import lru_cache
+from .prefixes import Prefix, PREFIXES, EMPTY_PREFIX
+from .units import Units, COMPOSITE_UNITS, DIMENSIONLESS, UNIT_PRIORITY
 
+# Drop spaces and accept the middle dot as multiplication
+_TRANS = str.maketrans({"·": "*", " ": None})
+# One unit token per match: an operator, or a symbol with an optional ^exponent
+_TOKENIZER = re.compile(r"(?P<op>[*/])|(?P<sym>[a-zA-ZµΩ]+)(?:\^(?P<exp>-?\d+))?")
+_OPERATORS = re.compile(r"[*/]")
+# SI base symbols, used if they are missing from COMPOSITE_UNITS
+_BASE_UNITS = {
+    "m": Units(length=1), "kg": Units(mass=1), "s": Units(time=1),
+    "A": Units(electric_current=1), "K": Units(temperature=1),
+    "mol": Units(amount_of_substance=1), "cd": Units(luminous_intensity=1),
+}
+
+@lru_cache(maxsize=1024)
 def parse_units(expr: str) -> Units:
-    """Parse compound expressions like 'N*m/s^2' or 'kg*m^2/s^3'."""
-    expr = expr.replace("·", "*").replace(" ", "").replace(r"//", r"/")
-    tokens = re.split(r"([*/])", expr)
-    result = Units()
+    """
+    Parse compound expressions like 'N*m/s^2' or 'kg*m^2/s^3'.
+    Results are cached (Units are interned and immutable); make_units clears the cache.
+    """
+    expr = expr.translate(_TRANS)
+    result = DIMENSIONLESS
     op = "*"
-    for token in tokens:
-        if token in ("*", "/"):
-            op = token
-            continue
-        if not token:
-            continue
-        m = re.match(r"([a-zA-ZµΩ]+)(?:\^(-?\d+))?$", token)
-        if not m:
+    token_start = pos = 0
+    while pos < len(expr):
+        m = _TOKENIZER.match(expr, pos)
+        # A symbol must be followed by an operator or the end of the expression,
+        # checked before the lookup so 'xx2' is reported as a token, not as unit 'xx'
+        if m is None or (m.group("sym") and m.end() < len(expr) and expr[m.end()] not in "*/"):
+            token = _OPERATORS.split(expr[token_start:], 1)[0]
             raise ValueError(f"Invalid unit token: {token}")
-        symbol, exp = m.groups()
+        pos = m.end()
+        if m.group("op"):
+            op = m.group("op")
+            token_start = pos
+            continue
+        symbol, exp = m.group("sym", "exp")
         exp = int(exp) if exp else 1
         u = COMPOSITE_UNITS.get(symbol)
-        if not u:
-            if symbol in ["m", "kg", "s", "A", "K", "mol", "cd"]:
-                u = Units(**{{
-                    "m": "length", "kg": "mass", "s": "time", "A": "electric_current",
-                    "K": "temperature", "mol": "amount_of_substance", "cd": "luminous_intensity"
-                }[symbol]: 1})
-            else:
+        if u is None:
+            u = _BASE_UNITS.get(symbol)
+            if u is None:
                 raise ValueError(f"Unknown unit: {symbol}")
         u = u ** exp
         result = result * u if op == "*" else result / u
     return result
 
+def _is_si_expr(expr: str) -> bool:
+    """
+    True when every symbol of a parsed unit expression is an SI name: a base symbol, a derived
+    unit with SI priority (>= 3), or a metric name preferred for its dimensions ('rad').
+    Names such as 'ft', 'cal' or 'mph' need a conversion factor.
+    """
+    if expr in COMPOSITE_UNITS:  # also names the tokenizer cannot split, like 'cm²'
+        return _is_si_symbol(expr)
+    return all(
+        _is_si_symbol(m.group("sym"))
+        for m in _TOKENIZER.finditer(expr.translate(_TRANS))
+        if m.group("sym")
+    )
+
+def _is_si_symbol(symbol: str) -> bool:
+    if symbol in _BASE_UNITS:
+        return True
+    units = COMPOSITE_UNITS.get(symbol)
+    priority = UNIT_PRIORITY.get(symbol, 2)
+    return units is not None and (priority >= 3 or priority == 2 and units.composite_name() == symbol)
+
 
 class Quantity:
+    # Units are interned, so the unit checks below try identity before equality
+    __slots__ = ("value", "prefix", "units")
+    # Make NumPy defer to Quantity's reflected operators (ndarray * Quantity)
+    __array_ufunc__ = None
+
     def __init__(self, value, prefix: Prefix, units: Units):
         self.value = value
         self.prefix = prefix
         self.units = units
 
     def __add__(self, other):
-        if self.units != other.units:
+        if self.units is not other.units and self.units != other.units:
             raise ValueError("Incompatible units for addition")
-        v = self.value * float(self.prefix.factor) + other.value * float(other.prefix.factor)
-        return Quantity(v, Prefix(""), self.units)
+        v = self.value * self.prefix.factor + other.value * other.prefix.factor
+        return Quantity(v, EMPTY_PREFIX, self.units)
     def __sub__(self, other):
-        if self.units != other.units:
+        if self.units is not other.units and self.units != other.units:
             raise ValueError("Incompatible units for subtraction")
-        v = self.value * float(self.prefix.factor) - other.value * float(other.prefix.factor)
-        return Quantity(v, Prefix(""), self.units)
+        v = self.value * self.prefix.factor - other.value * other.prefix.factor
+        return Quantity(v, EMPTY_PREFIX, self.units)
     def __neg__(self):
         return Quantity(-self.value, self.prefix, self.units)
 
@@ -65,10 +108,16 @@ class Quantity:
             return Quantity(self.value / other.value, self.prefix / other.prefix, self.units / other.units)
         return Quantity(self.value / other, self.prefix, self.units)
     def __rtruediv__(self, other):
-        return Quantity(other / self.value, other.prefix / self.prefix, Units() / self.units)
+        return Quantity(other / self.value, EMPTY_PREFIX / self.prefix, DIMENSIONLESS / self.units)
 
     def __pow__(self, power):
-        return Quantity(self.value ** power, Prefix(""), self.units ** power)
+        # The prefix is raised along with the value, e.g. (2 km)² = 4e6 m²
+        value = self.value if self.prefix is EMPTY_PREFIX else self.value * self.prefix.factor
+        return Quantity(value ** power, EMPTY_PREFIX, self.units ** power)
+
+    def exact(self):
+        """Return this quantity unprefixed, with an exact Fraction value."""
+        return Quantity(Fraction(self.value) * self.prefix.exact_factor, EMPTY_PREFIX, self.units)
 
     def simplify(self):
         name = self.units.composite_name()
@@ -76,47 +125,89 @@ class Quantity:
 
     def convert(self, prefix_str: str):
         target_prefix = Prefix(prefix_str)
-        factor = float(self.prefix.factor) / float(target_prefix.factor)
+        factor = self.prefix.factor / target_prefix.factor
         return Quantity(self.value * factor, target_prefix, self.units)
 
     def to(self, unit_expr: str):
-        """Convert to another compatible unit expression (like 'km' or 'ms')."""
-        new_units = parse_units(unit_expr)
-        if new_units != self.units:
-            raise ValueError(f"Cannot convert {self.units} to {new_units}")
-        for p in PREFIXES:
-            if unit_expr.startswith(p):
-                return self.convert(p)
-        return self
+        """
+        Convert to another compatible unit expression (like 'km' or 'ms').
+        Only prefixes are applied, so the unit itself must be SI; use convert_unit for 'ft', 'cal', ...
+
+        Example:
+            >>> distance = Quantity(5, Prefix('k'), Units(length=1))
+            >>> distance.to('m'), distance.to('mm'), distance.to('kdam')
+            (5000.0 m, 5000000.0 mm, 0.5 kdam)
+            >>> Quantity(2, Prefix(''), Units(time=1)).to('ms')
+            2000.0 ms
+            >>> distance.to('kft')
+            Traceback (most recent call last):
+            ValueError: Not an SI unit: ft, use convert_unit
+            >>> Quantity(2, Prefix(''), Units(mass=1)).to('mg')
+            Traceback (most recent call last):
+            ValueError: Not an SI unit: g, use convert_unit
+            >>> Quantity(3, Prefix(''), COMPOSITE_UNITS['J']).to('kcal')
+            Traceback (most recent call last):
+            ValueError: Not an SI unit: cal, use convert_unit
+        """
+        # The whole expression first ('cd', 'Pa'), then the longest prefix whose remainder parses
+        splits = [("", unit_expr)] + [
+            (unit_expr[:n], unit_expr[n:])
+            for n in range(len(unit_expr) - 1, 0, -1)
+            if unit_expr[:n] in PREFIXES
+        ]
+        error = rejected = None
+        for prefix, rest in splits:
+            try:
+                new_units = parse_units(rest)
+            except ValueError as e:
+                error = error or e
+                continue
+            if not _is_si_expr(rest):
+                # Rescaling by the prefix alone would drop the unit's conversion factor
+                rejected = rejected or ValueError(f"Not an SI unit: {rest}, use convert_unit")
+                continue
+            if new_units != self.units:
+                raise ValueError(f"Cannot convert {self.units} to {new_units}")
+            return self.convert(prefix)
+        raise rejected or error
 
     def __repr__(self):
         prefix = str(self.prefix)
         return f"{self.value} {prefix}{str(self.units)}"
     # Comparison operators
     def __eq__(self, other):
-        return (self.value * float(self.prefix.factor) == other.value * float(other.prefix.factor)
-                and self.units == other.units)
+        # Units first, so array values compare element-wise instead of going through `and`
+        if self.units is not other.units and self.units != other.units:
+            return False
+        return self.value * self.prefix.factor == other.value * other.prefix.factor
     def __lt__(self, other):
-        if self.units != other.units:
+        if self.units is not other.units and self.units != other.units:
             raise ValueError("Incompatible units for comparison")
-        return (self.value * float(self.prefix.factor) <
-                other.value * float(other.prefix.factor))
+        return (self.value * self.prefix.factor <
+                other.value * other.prefix.factor)
     def __le__(self, other):
-        if self.units != other.units:
+        if self.units is not other.units and self.units != other.units:
             raise ValueError("Incompatible units for comparison")
-        return (self.value * float(self.prefix.factor) <=
-                other.value * float(other.prefix.factor))
+        return (self.value * self.prefix.factor <=
+                other.value * other.prefix.factor)
     def __gt__(self, other):
-        if self.units != other.units:
+        if self.units is not other.units and self.units != other.units:
             raise ValueError("Incompatible units for comparison")
-        return (self.value * float(self.prefix.factor) >
-                other.value * float(other.prefix.factor))
+        return (self.value * self.prefix.factor >
+                other.value * other.prefix.factor)
     def __ge__(self, other):
-        if self.units != other.units:
+        if self.units is not other.units and self.units != other.units:
             raise ValueError("Incompatible units for comparison")
-        return (self.value * float(self.prefix.factor) >=
-                other.value * float(other.prefix.factor))
+        return (self.value * self.prefix.factor >=
+                other.value * other.prefix.factor)
     def __ne__(self, other):
-        return not self.__eq__(other)
+        if self.units is not other.units and self.units != other.units:
+            return True
+        return self.value * self.prefix.factor != other.value * other.prefix.factor
     def __hash__(self):
-        return hash((self.value * float(self.prefix.factor), self.units))
+        return hash((self.value * self.prefix.factor, self.units))
+
+def quantity_array(values, prefix: Prefix, units: Units) -> Quantity:
+    """Build a Quantity whose value is a NumPy float array (requires numpy)."""
+    import numpy as np
+    return Quantity(np.asarray(values, dtype=float), prefix, units)
@@ -2,11 +2,12 @@ from setuptools import setup, find_packages
 
 setup(
     name="physunits",
-    version="0.2.3",
+    version="0.3.0",
     author="ChessGuyyy",
     description="A lightweight dimensional analysis and physics unit system",
     packages=find_packages(),
     install_requires=[],
+    extras_require={"numpy": ["numpy"], "numba": ["numpy", "numba"]},
     python_requires=">=3.8",
     keywords=["physics", "units", "dimensional analysis"],
     url="https://www.github.com/cycy98/physunits"
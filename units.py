@@ -1,85 +1,174 @@
+from functools import lru_cache
+from numbers import Real
+
+# Interned Units instances keyed by their exponent tuple (see Units._of)
+_UNITS_CACHE = {}
+# Exponent names and base unit symbols in the canonical as_tuple() order,
+# shared by the constructor, hashing, equality, repr and the composite name table
+_KEY_NAMES = ("length", "mass", "time", "electric_current",
+              "temperature", "amount_of_substance", "luminous_intensity")
+_SYMBOLS = ("m", "kg", "s", "A", "K", "mol", "cd")
+
 class Units:
-    """Represents SI base unit exponents: m, kg, s, A, K, mol, cd."""
-    def __init__(self, length=0, mass=0, time=0, electric_current=0,
-                 temperature=0, amount_of_substance=0, luminous_intensity=0):
-        self.length = length
-        self.mass = mass
-        self.time = time
-        self.electric_current = electric_current
-        self.temperature = temperature
-        self.amount_of_substance = amount_of_substance
-        self.luminous_intensity = luminous_intensity
+    """
+    Represents SI base unit exponents: m, kg, s, A, K, mol, cd.
+    Instances are interned: equal exponents give the same object, so they are immutable.
+    The exponents are kept both as attributes (fast arithmetic) and as the tuple `_e`
+    (the interning key, used for comparisons without building a new tuple).
+    """
+    __slots__ = _KEY_NAMES + ("_e", "_hash")
+
+    def __new__(cls, length=0, mass=0, time=0, electric_current=0,
+                temperature=0, amount_of_substance=0, luminous_intensity=0):
+        return cls._of((length, mass, time, electric_current,
+                        temperature, amount_of_substance, luminous_intensity))
+
+    @classmethod
+    def _of(cls, key):
+        """Return the interned Units for an exponent tuple in as_tuple() order."""
+        units = _UNITS_CACHE.get(key)
+        if units is None:
+            # Equal tuples share one instance, so store integral exponents as int
+            # (not 5.0 or Fraction(5)), whichever form created the instance first
+            key = tuple(exp if type(exp) is int else _integral(exp) for exp in key)
+            units = object.__new__(cls)
+            # __setattr__ is blocked, so slots are filled through object's
+            set_slot = object.__setattr__
+            set_slot(units, "_e", key)
+            set_slot(units, "_hash", hash(key))
+            for name, exp in zip(_KEY_NAMES, key):
+                set_slot(units, name, exp)
+            _UNITS_CACHE[key] = units
+        return units
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Units are immutable, cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Units are immutable, cannot delete {name!r}")
+
+    def __reduce__(self):
+        # Rebuild through the cache instead of filling a fresh instance's slots
+        return (Units, self.as_tuple())
 
     def __mul__(self, other):
-        return Units(
-            self.length + other.length,
-            self.mass + other.mass,
-            self.time + other.time,
-            self.electric_current + other.electric_current,
-            self.temperature + other.temperature,
-            self.amount_of_substance + other.amount_of_substance,
-            self.luminous_intensity + other.luminous_intensity,
-        )
+        if not isinstance(other, Units):
+            return NotImplemented
+        return _mul(self, other)
 
     def __truediv__(self, other):
-        return Units(
-            self.length - other.length,
-            self.mass - other.mass,
-            self.time - other.time,
-            self.electric_current - other.electric_current,
-            self.temperature - other.temperature,
-            self.amount_of_substance - other.amount_of_substance,
-            self.luminous_intensity - other.luminous_intensity,
-        )
+        if not isinstance(other, Units):
+            return NotImplemented
+        return _div(self, other)
 
     def __pow__(self, power):
-        return Units(
-            self.length * power,
-            self.mass * power,
-            self.time * power,
-            self.electric_current * power,
-            self.temperature * power,
-            self.amount_of_substance * power,
-            self.luminous_intensity * power,
-        )
+        # int/float skip the ABC check; anything else must be a Real (hashable) before the cache lookup
+        if type(power) is int or type(power) is float or isinstance(power, Real):
+            return _pow(self, power)
+        return NotImplemented
+
+    def as_tuple(self):
+        """Exponents in (m, kg, s, A, K, mol, cd) order."""
+        return self._e
 
     def __eq__(self, other):
-        return vars(self) == vars(other)
+        if self is other:
+            return True
+        if not isinstance(other, Units):
+            return NotImplemented
+        return self._e == other._e
 
     def __repr__(self):
+        text = _REPR_CACHE.get(self._e)
+        if text is None:
+            text = _REPR_CACHE[self._e] = self._build_repr()
+        return text
+
+    def _build_repr(self):
         name = self.composite_name()
-        if UNIT_PRIORITY.get(name,1) >= 2:
+        if name in _PREFERRED_NAMES:
             return name
-        parts = []
-        for symbol, exp in zip(
-            ["m", "kg", "s", "A", "K", "mol", "cd"],
-            [self.length, self.mass, self.time, self.electric_current,
-             self.temperature, self.amount_of_substance, self.luminous_intensity]
-        ):
-            if exp != 0:
-                parts.append(f"{symbol}^{exp}" if exp != 1 else symbol)
+        parts = [
+            f"{symbol}^{exp}" if exp != 1 else symbol
+            for symbol, exp in zip(_SYMBOLS, self._e)
+            if exp != 0
+        ]
         return ".".join(parts) if parts else "dimensionless"
     def __hash__(self):
-        return hash((
-            self.length,
-            self.mass,
-            self.time,
-            self.electric_current,
-            self.temperature,
-            self.luminous_intensity,
-            self.amount_of_substance
-        ))
+        return self._hash
 
     def composite_name(self):
-        best = ""
-        best_prio = 0
-        for name, unit in COMPOSITE_UNITS.items():
-            if self == unit:
-                prio = UNIT_PRIORITY.get(name, 2)  # default to medium priority
-                if prio > best_prio:
-                    best = name
-                    best_prio = prio
-        return best
+        return _COMPOSITE_BY_KEY.get(self.as_tuple(), "")
+
+def _integral(exp):
+    """Return exp as an int when it is a whole number, otherwise unchanged."""
+    try:
+        whole = int(exp)
+    except (TypeError, ValueError, OverflowError):
+        return exp
+    return whole if whole == exp else exp
+
+# a * b and a / b per operand pair, keyed on the interned Units (hashed via _hash)
+@lru_cache(maxsize=1024)
+def _mul(a, b):
+    return Units._of((
+        a.length + b.length,
+        a.mass + b.mass,
+        a.time + b.time,
+        a.electric_current + b.electric_current,
+        a.temperature + b.temperature,
+        a.amount_of_substance + b.amount_of_substance,
+        a.luminous_intensity + b.luminous_intensity,
+    ))
+
+@lru_cache(maxsize=1024)
+def _div(a, b):
+    return Units._of((
+        a.length - b.length,
+        a.mass - b.mass,
+        a.time - b.time,
+        a.electric_current - b.electric_current,
+        a.temperature - b.temperature,
+        a.amount_of_substance - b.amount_of_substance,
+        a.luminous_intensity - b.luminous_intensity,
+    ))
+
+# Int, Fraction and float powers alike are cached, so Fraction products run once per
+# (units, power); bounded, since any number of distinct powers can be requested
+@lru_cache(maxsize=256)
+def _pow(units, power):
+    return Units._of((
+        units.length * power,
+        units.mass * power,
+        units.time * power,
+        units.electric_current * power,
+        units.temperature * power,
+        units.amount_of_substance * power,
+        units.luminous_intensity * power,
+    ))
+
+# The interned all-zero Units, shared by every dimensionless result
+DIMENSIONLESS = Units()
+
+# Exponent tuple -> highest-priority COMPOSITE_UNITS name, see update_composite_names
+_COMPOSITE_BY_KEY = {}
+# Exponent tuple -> repr string, cleared with the name table
+_REPR_CACHE = {}
+# Names with priority >= 2, which repr uses instead of the base-unit form
+_PREFERRED_NAMES = set()
+def update_composite_names():
+    """Rebuild the composite name lookup based on COMPOSITE_UNITS and UNIT_PRIORITY."""
+    best_prio = {}
+    _COMPOSITE_BY_KEY.clear()
+    _REPR_CACHE.clear()
+    _PREFERRED_NAMES.clear()
+    _PREFERRED_NAMES.update(name for name, prio in UNIT_PRIORITY.items() if prio >= 2)
+    for name, unit in COMPOSITE_UNITS.items():
+        key = unit.as_tuple()
+        prio = UNIT_PRIORITY.get(name, 2)  # default to medium priority
+        if prio > best_prio.get(key, 0):
+            _COMPOSITE_BY_KEY[key] = name
+            best_prio[key] = prio
 
 COMPOSITE_UNITS = {
     "m": Units(length=1),                                       # Meter or Metre
@@ -126,8 +215,8 @@ COMPOSITE_UNITS = {
     "dyn": Units(mass=1, length=1, time=-2),                    # Dyne (same units as Newton)
     "lbf": Units(mass=1, length=1, time=-2),                    # Pound-force
     "hp": Units(mass=1, length=2, time=-3),                     # Horsepower (same units as Watt)
-    "rad": Units(),                                             # Radian (dimensionless)
-    "deg": Units(),                                             # Degree (dimensionless)
+    "rad": DIMENSIONLESS,                                       # Radian (dimensionless)
+    "deg": DIMENSIONLESS,                                       # Degree (dimensionless)
     "m²": Units(length=2),                                      # Square meter
     "cm²": Units(length=2),                                     # Square centimeter
     "acre": Units(length=2),                                    # Acre
@@ -204,4 +293,6 @@ UNIT_PRIORITY = {
     "ft³": 1,
     "mph": 1,
     "knot": 1,
-}
\ No newline at end of file
+}
+
+update_composite_names()